@@ -32,7 +32,7 @@ from .helpers import (
     var,
 )
 from .result import Err, Ok, Result
-from .serialization import dumps, loads
+from .serialization import dump, dumps, load, loads
 from .signature import (
     FnParam,
     FnSymbol,
@@ -137,7 +137,9 @@ __all__ = [
     "match_spec",
     "match_spec_sync",
     # --- Serialization ---
+    "dump",
     "dumps",
+    "load",
     "loads",
     # --- Result ---
     "Ok",
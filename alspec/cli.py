@@ -1,12 +1,11 @@
 import argparse
 import asyncio
-import hashlib
 import sys
 from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 
-from alspec.gen_reference import generate_reference
+from alspec.gen_reference import generate_reference, reference_digest
 from alspec.load import load_spec_from_file
 from alspec.llm import AsyncLLMClient
 from alspec.result import Err, Ok
@@ -240,8 +239,7 @@ async def handle_eval(
         print("No domains matched the criteria.")
         return 1
 
-    ref_text = generate_reference()
-    prompt_version = f"v3 (sha256: {hashlib.sha256(ref_text.encode()).hexdigest()[:8]})"
+    prompt_version = f"v3 (sha256: {reference_digest()[:8]})"
 
     upstream_snapshots = {}
     if cache:
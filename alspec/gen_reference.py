@@ -13,6 +13,9 @@ Run: python -m alspec.gen_reference > LANGUAGE_REFERENCE.md
 
 from __future__ import annotations
 
+import functools
+import hashlib
+
 from alspec.prompt import render
 from alspec.reference import (
     api_reference,
@@ -24,8 +27,9 @@ from alspec.reference import (
 )
 
 
+@functools.cache
 def generate_reference() -> str:
-    """Generate the full language reference document."""
+    """Generate the full language reference document (rendered once per process)."""
     return render(
         "language_reference.md.j2",
         formal_frame=formal_frame.render(),
@@ -37,5 +41,11 @@ def generate_reference() -> str:
     )
 
 
+@functools.cache
+def reference_digest() -> str:
+    """SHA-256 hex digest of the generated reference, for prompt versioning."""
+    return hashlib.sha256(generate_reference().encode()).hexdigest()
+
+
 if __name__ == "__main__":
     print(generate_reference())
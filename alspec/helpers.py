@@ -44,14 +44,14 @@ def fn(
 ) -> FnSymbol:
     return FnSymbol(
         name=name,
-        params=tuple(param(n, s) for n, s in params),
+        params=tuple([param(n, s) for n, s in params]),
         result=S(result),
         totality=Totality.TOTAL if total else Totality.PARTIAL,
     )
 
 
 def pred(name: str, params: list[tuple[str, str]]) -> PredSymbol:
-    return PredSymbol(name=name, params=tuple(param(n, s) for n, s in params))
+    return PredSymbol(name=name, params=tuple([param(n, s) for n, s in params]))
 
 
 def var(name: str, sort: str) -> Var:
@@ -59,7 +59,7 @@ def var(name: str, sort: str) -> Var:
 
 
 def app(fn_name: str, *args: Term) -> FnApp:
-    return FnApp(fn_name=fn_name, args=tuple(args))
+    return FnApp(fn_name=fn_name, args=args)
 
 
 def const(name: str) -> FnApp:
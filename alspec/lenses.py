@@ -21,6 +21,11 @@ SOURCES_DIR = DATA_DIR / "sources"
 LENSES_CACHE_DIR = DATA_DIR / "lenses"
 ANALYSIS_CACHE_DIR = Path("data/analysis")
 
+# Source text by (path, headed), validated on (mtime, size) so edits during a
+# long eval run are picked up (including a rewrite within one mtime tick that
+# changes the length) while repeat replicates skip the read, decode and format.
+_SOURCE_TEXT: dict[tuple[Path, bool], tuple[tuple[int, int], str]] = {}
+
 # --- Lens Definitions ---
 # System prompts for each lens type.  Source material goes in the user message,
 # not substituted into the system prompt.
@@ -68,6 +73,25 @@ Write your summary now.""",
 }
 
 
+def _read_source(path: Path, *, headed: bool = False) -> str:
+    """Read a source file, reusing the last result while its mtime and size hold.
+
+    With ``headed=True`` the cached value is the ``--- Source: name ---``
+    block used by load_sources, so the formatting is done once as well.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (path, headed)
+    hit = _SOURCE_TEXT.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    text = path.read_text()
+    if headed:
+        text = f"--- Source: {path.name} ---\n{text}"
+    _SOURCE_TEXT[key] = (stamp, text)
+    return text
+
+
 def load_source(domain: str, source_path: str | None = None) -> str:
     """Load source material for a domain.
 
@@ -79,11 +103,11 @@ def load_source(domain: str, source_path: str | None = None) -> str:
     if source_path:
         p = Path(source_path)
         if p.exists():
-            return p.read_text()
+            return _read_source(p)
 
     cached_source = SOURCES_DIR / f"{domain}.txt"
     if cached_source.exists():
-        return cached_source.read_text()
+        return _read_source(cached_source)
 
     return ""
 
@@ -102,13 +126,13 @@ def load_sources(domain_id: str, extra_sources: list[Path] | None = None) -> str
     if extra_sources:
         for src_path in extra_sources:
             if src_path.exists():
-                parts.append(f"--- Source: {src_path.name} ---\n{src_path.read_text()}")
+                parts.append(_read_source(src_path, headed=True))
 
     if not parts:
         # Fallback to cached Wikipedia source
         cached = SOURCES_DIR / f"{domain_id}.txt"
         if cached.exists():
-            parts.append(cached.read_text())
+            parts.append(_read_source(cached))
 
     return "\n\n".join(parts)
 
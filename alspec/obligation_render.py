@@ -65,17 +65,40 @@ def render_obligation_prompt(
         info = sig.generated_sorts[gen_sort]
         ctor_names = list(info.constructors)
 
+        fn_observers = sorted(
+            n
+            for n, r in table.fn_roles.items()
+            if r.kind == FnKind.OBSERVER and r.sort == gen_sort
+        )
+        pred_observers = sorted(
+            n
+            for n, r in table.pred_roles.items()
+            if r.kind == PredKind.OBSERVER and r.sort == gen_sort
+        )
+        equality_preds = sorted(
+            n
+            for n, r in table.pred_roles.items()
+            if r.kind == PredKind.EQUALITY and r.sort == gen_sort
+        )
+        partial_constructors = [c for c in ctor_names if c in partial_fns]
+
         # Header for the sort
         parts.append(f"## Sort: {gen_sort}\n")
 
+        # Nothing to ask for: skip the role summary and both sections
+        if not (
+            cells
+            or fn_observers
+            or pred_observers
+            or equality_preds
+            or partial_constructors
+        ):
+            parts.append("(no observers — no axiom obligations for this sort)\n")
+            continue
+
         # Role summary
         parts.append(f"**Constructors:** {_fn_list(ctor_names, partial_fns, sig)}")
 
-        fn_observers = sorted(
-            n
-            for n, r in table.fn_roles.items()
-            if r.kind == FnKind.OBSERVER and r.sort == gen_sort
-        )
         # Filter profiles to ONLY show the ones for this sort
         parts.append(f"**Observers:** {_fn_list(fn_observers, partial_fns, sig)}")
 
@@ -89,11 +112,6 @@ def render_obligation_prompt(
         else:
             parts.append("**Selectors:** (none)")
 
-        pred_observers = sorted(
-            n
-            for n, r in table.pred_roles.items()
-            if r.kind == PredKind.OBSERVER and r.sort == gen_sort
-        )
         if pred_observers:
             parts.append(
                 f"**Predicates:** {', '.join(f'`{p}`' for p in pred_observers)}"
@@ -231,13 +249,6 @@ def render_obligation_prompt(
             parts.append("")
 
         # Additional axioms (outside the table)
-        equality_preds = sorted(
-            n
-            for n, r in table.pred_roles.items()
-            if r.kind == PredKind.EQUALITY and r.sort == gen_sort
-        )
-        partial_constructors = [c for c in ctor_names if c in partial_fns]
-
         extras: list[str] = []
         if equality_preds:
             for ep in equality_preds:
@@ -49,34 +49,38 @@ class StageUsage:
     stage: str
     usage: UsageInfo | None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True)
 class PipelineResult:
-    """Complete result from the 4-stage pipeline."""
+    """Complete result from the 4-stage pipeline.
+
+    Only ``success`` and the timing fields are required; every stage output
+    defaults to ``None`` so each return site names just what it produced.
+    """
     success: bool
 
     # Stage 1: Analysis
-    domain_analysis: str | None
+    domain_analysis: str | None = None
 
     # Stage 2: Signature
-    signature: Signature | None
-    signature_code: str | None
-    signature_analysis: str | None
+    signature: Signature | None = None
+    signature_code: str | None = None
+    signature_analysis: str | None = None
 
     # Stage 3: Obligation
-    obligation_table: ObligationTable | None
-    obligation_table_rendered: str | None
+    obligation_table: ObligationTable | None = None
+    obligation_table_rendered: str | None = None
 
     # Stage 4: Axioms
-    spec: Spec | None
-    spec_code: str | None
-    spec_analysis: str | None
+    spec: Spec | None = None
+    spec_code: str | None = None
+    spec_analysis: str | None = None
 
     # Scoring
-    score: SpecScore | None
+    score: SpecScore | None = None
 
     # Errors
-    error: str | None
-    error_stage: str | None
+    error: str | None = None
+    error_stage: str | None = None
 
     # Timing & usage
     stage_usages: tuple[StageUsage, ...]
@@ -122,7 +126,6 @@ def _error_result(
         spec=spec,
         spec_code=spec_code,
         spec_analysis=spec_analysis,
-        score=None,
         error=error,
         error_stage=error_stage,
         stage_usages=tuple(stage_usages),
@@ -175,14 +178,6 @@ async def run_pipeline_signature_only(
             signature=signature_out.signature,
             signature_code=signature_out.code,
             signature_analysis=signature_out.analysis,
-            obligation_table=None,
-            obligation_table_rendered=None,
-            spec=None,
-            spec_code=None,
-            spec_analysis=None,
-            score=None,
-            error=None,
-            error_stage=None,
             stage_usages=tuple(stage_usages),
             total_latency_ms=int((time.time() - start_time) * 1000),
         )
@@ -258,7 +253,6 @@ async def run_pipeline(
             spec_code=ax_out.code,
             spec_analysis=ax_out.analysis,
             score=ax_out.score,
-            error=None, error_stage=None,
             stage_usages=tuple(stage_usages),
             total_latency_ms=int((time.time() - start_time) * 1000),
         )
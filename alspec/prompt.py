@@ -5,13 +5,16 @@ from typing import Any
 
 import jinja2
 
-# Setup jinja2 environment pointing to alspec/templates
+# Setup jinja2 environment pointing to alspec/templates.
+# Templates ship with the package, so skip jinja's per-render mtime check
+# and reuse each compiled template for the life of the process.
 _TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
 _ENV = jinja2.Environment(
     loader=jinja2.FileSystemLoader(_TEMPLATE_DIR),
     autoescape=False,
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
 )
 
 
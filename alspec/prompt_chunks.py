@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from collections import deque
 from dataclasses import dataclass
@@ -157,8 +158,9 @@ def register(
 ) -> Callable[[Callable[[], str]], Callable[[], str]]:
     """Decorator to register a chunk renderer.
 
-    The decorated function returns str (the chunk content).
-    It is stored in the registry and remains callable.
+    The decorated function returns str (the chunk content). Chunk content
+    is static, so the renderer is memoized before it is stored in the
+    registry; the returned callable is the memoized one.
 
     Raises ValueError at import time if the ChunkId is already registered.
     """
@@ -166,14 +168,15 @@ def register(
     def decorator(fn: Callable[[], str]) -> Callable[[], str]:
         if id in _REGISTRY:
             raise ValueError(f"Duplicate chunk registration: {id.name}")
+        cached = functools.cache(fn)
         _REGISTRY[id] = PromptChunk(
             id=id,
             stages=stages,
             concepts=concepts,
             depends_on=depends_on,
-            render=fn,
+            render=cached,
         )
-        return fn
+        return cached
 
     return decorator
 
@@ -1,36 +1,35 @@
-import textwrap
+import functools
 
 from alspec.basis import ALL_BASIS_SPECS
 
+_HEADER = """\
+## 4. Basis Library (Standard Patterns)
 
-def render() -> str:
-    parts: list[str] = []
+Pre-built, verified specifications covering fundamental algebraic patterns.
+Use these to recognize when your domain matches an existing pattern.
+Sources: CASL Basic Libraries (CoFI), Sannella & Tarlecki (2012).
+
+**How to use basis operations in your signature:**
+- **Include only what you need.** If your axioms reference `zero`, `succ`, and `geq`,
+  include those in your signature's `functions` and `predicates` dicts. Do not include
+  operations you don't use (e.g., don't add `mul` if you only need counting).
+- **Do NOT add basis sorts to `generated_sorts`.** Basis sorts like Nat and Bool are
+  utility sorts, not domain sorts. Do not declare constructors, selectors, or
+  generated sort metadata for them. Only your domain's own generated sort (and its
+  enumerations) belong in `generated_sorts`.
+- **Basis operations are helpers, not observers.** They operate on parameter sorts,
+  never on the domain's generated sort. They create no obligation table rows.
+- **Recognize basis patterns.** If your domain is a keyed collection (store/add/lookup
+  by key), it follows the FiniteMap pattern. If it counts things, it uses Nat. Naming
+  the pattern helps you select the right operations.
+"""
 
-    parts.append(
-        textwrap.dedent(
-            """\
-            ## 4. Basis Library (Standard Patterns)
 
-            Pre-built, verified specifications covering fundamental algebraic patterns.
-            Use these to recognize when your domain matches an existing pattern.
-            Sources: CASL Basic Libraries (CoFI), Sannella & Tarlecki (2012).
+@functools.cache
+def render() -> str:
+    parts: list[str] = []
 
-            **How to use basis operations in your signature:**
-            - **Include only what you need.** If your axioms reference `zero`, `succ`, and `geq`,
-              include those in your signature's `functions` and `predicates` dicts. Do not include
-              operations you don't use (e.g., don't add `mul` if you only need counting).
-            - **Do NOT add basis sorts to `generated_sorts`.** Basis sorts like Nat and Bool are
-              utility sorts, not domain sorts. Do not declare constructors, selectors, or
-              generated sort metadata for them. Only your domain's own generated sort (and its
-              enumerations) belong in `generated_sorts`.
-            - **Basis operations are helpers, not observers.** They operate on parameter sorts,
-              never on the domain's generated sort. They create no obligation table rows.
-            - **Recognize basis patterns.** If your domain is a keyed collection (store/add/lookup
-              by key), it follows the FiniteMap pattern. If it counts things, it uses Nat. Naming
-              the pattern helps you select the right operations.
-            """
-        )
-    )
+    parts.append(_HEADER)
 
     for spec_fn in ALL_BASIS_SPECS:
         sp = spec_fn()
@@ -40,8 +39,8 @@ def render() -> str:
 
         # One-line description from docstring
         if spec_fn.__doc__:
-            doc = textwrap.dedent(spec_fn.__doc__).strip()
-            first_line = doc.split("\n")[0]
+            # strip() already drops the first line's indent; no dedent needed
+            first_line = spec_fn.__doc__.strip().split("\n")[0]
             parts.append(f"{first_line}\n")
 
         # Signature profile
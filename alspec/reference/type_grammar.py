@@ -1,43 +1,41 @@
-import textwrap
+_RENDERED = """\
+## 2. Type Grammar
 
+```
+Term     = var(name, sort)
+         | app(fn_name, *args)
+         | const(name)
+         | field_access(term, field_name)
+         | Literal(value, sort)
 
-def render() -> str:
-    return textwrap.dedent(
-        """\
-        ## 2. Type Grammar
+Formula  = eq(Term, Term)                          ← Equation
+         | pred_app(pred_name, Term, ...)           ← PredApp (varargs)
+         | negation(Formula)                        ← inner is a Formula, NEVER a Term
+         | conjunction(Formula, ...)                ← all args are Formulas (varargs)
+         | disjunction(Formula, ...)                ← all args are Formulas (varargs)
+         | implication(Formula, Formula)            ← both are Formulas
+         | iff(Formula, Formula)                    ← both are Formulas (Biconditional)
+         | forall(list[Var], Formula)
+         | exists(list[Var], Formula)
+         | definedness(Term)                        ← inner is a Term
+```
 
-        ```
-        Term     = var(name, sort)
-                 | app(fn_name, *args)
-                 | const(name)
-                 | field_access(term, field_name)
-                 | Literal(value, sort)
+### Valid Compositions
 
-        Formula  = eq(Term, Term)                          ← Equation
-                 | pred_app(pred_name, Term, ...)           ← PredApp (varargs)
-                 | negation(Formula)                        ← inner is a Formula, NEVER a Term
-                 | conjunction(Formula, ...)                ← all args are Formulas (varargs)
-                 | disjunction(Formula, ...)                ← all args are Formulas (varargs)
-                 | implication(Formula, Formula)            ← both are Formulas
-                 | iff(Formula, Formula)                    ← both are Formulas (Biconditional)
-                 | forall(list[Var], Formula)
-                 | exists(list[Var], Formula)
-                 | definedness(Term)                        ← inner is a Term
-        ```
+| Expression | Why it's correct |
+|-----------|------------------|
+| `eq(app(...), app(...))` | Both are Terms ✓ |
+| `eq(app(...), var(...))` | Both are Terms ✓ |
+| `negation(eq(...))` | eq returns a Formula ✓ |
+| `negation(pred_app(...))` | pred_app is a Formula ✓ |
+| `implication(pred_app(...), eq(...))` | Both are Formulas ✓ |
+| `iff(pred_app(...), pred_app(...))` | Formula ⇔ Formula ✓ |
+| `iff(pred_app(...), eq(...))` | Formula ⇔ Formula ✓ |
+| `conjunction(pred_app(...), pred_app(...))` | All args are Formulas ✓ |
 
-        ### Valid Compositions
+---
+"""
 
-        | Expression | Why it's correct |
-        |-----------|------------------|
-        | `eq(app(...), app(...))` | Both are Terms ✓ |
-        | `eq(app(...), var(...))` | Both are Terms ✓ |
-        | `negation(eq(...))` | eq returns a Formula ✓ |
-        | `negation(pred_app(...))` | pred_app is a Formula ✓ |
-        | `implication(pred_app(...), eq(...))` | Both are Formulas ✓ |
-        | `iff(pred_app(...), pred_app(...))` | Formula ⇔ Formula ✓ |
-        | `iff(pred_app(...), eq(...))` | Formula ⇔ Formula ✓ |
-        | `conjunction(pred_app(...), pred_app(...))` | All args are Formulas ✓ |
 
-        ---
-        """
-    )
+def render() -> str:
+    return _RENDERED
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from .check import Severity
+from .check import Diagnostic, Severity
 from .score import SpecScore
 
 
@@ -16,21 +16,26 @@ def format_report(score: SpecScore) -> str:
     else:
         lines.append(f"  × Ill-formed ({score.error_count} errors)")
 
+    # One pass over the diagnostics, partitioned by severity.
+    error_lines: list[str] = []
+    warning_lines: list[str] = []
     for diag in score.diagnostics:
-        if diag.severity == Severity.ERROR:
+        sev = diag.severity
+        if sev is Severity.ERROR:
             axiom_str = f" axiom '{diag.axiom}':" if diag.axiom else ""
-            lines.append(f"    - [{diag.check}]{axiom_str} {diag.message} (ERROR)")
+            error_lines.append(f"    - [{diag.check}]{axiom_str} {diag.message} (ERROR)")
+        elif sev is Severity.WARNING:
+            axiom_str = f" axiom '{diag.axiom}':" if diag.axiom else ""
+            warning_lines.append(
+                f"    - [{diag.check}]{axiom_str} {diag.message} (WARNING)"
+            )
+
+    lines.extend(error_lines)
 
-    if score.warning_count > 0:
-        lines.append(
-            f"  ⚠ {score.warning_count} warning{'s' if score.warning_count > 1 else ''}"
-        )
-        for diag in score.diagnostics:
-            if diag.severity == Severity.WARNING:
-                axiom_str = f" axiom '{diag.axiom}':" if diag.axiom else ""
-                lines.append(
-                    f"    - [{diag.check}]{axiom_str} {diag.message} (WARNING)"
-                )
+    warning_count = len(warning_lines)
+    if warning_count > 0:
+        lines.append(f"  ⚠ {warning_count} warning{'s' if warning_count > 1 else ''}")
+        lines.extend(warning_lines)
 
     lines.append(
         f"  Signature: {score.sort_count} sorts, {score.function_count} functions, {score.predicate_count} predicates, {score.axiom_count} axioms"
@@ -39,6 +44,16 @@ def format_report(score: SpecScore) -> str:
     return "\n".join(lines)
 
 
+def _diag_to_dict(d: Diagnostic) -> dict[str, Any]:
+    return {
+        "check": d.check,
+        "severity": d.severity.value,
+        "axiom": d.axiom,
+        "message": d.message,
+        "path": d.path,
+    }
+
+
 def report_json(score: SpecScore) -> dict[str, Any]:
     """Machine-readable report for pipeline integration."""
     return {
@@ -51,14 +66,5 @@ def report_json(score: SpecScore) -> dict[str, Any]:
         "function_count": score.function_count,
         "predicate_count": score.predicate_count,
         "axiom_count": score.axiom_count,
-        "diagnostics": [
-            {
-                "check": d.check,
-                "severity": d.severity.value,
-                "axiom": d.axiom,
-                "message": d.message,
-                "path": d.path,
-            }
-            for d in score.diagnostics
-        ],
+        "diagnostics": list(map(_diag_to_dict, score.diagnostics)),
     }
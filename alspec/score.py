@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 
 from .analysis import audit_spec
-from .check import Diagnostic, check_spec
+from .check import Diagnostic, Severity, check_spec
 from .spec import Spec
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecScore:
     spec_name: str
     well_formed: bool
@@ -27,7 +28,9 @@ class SpecScore:
     coverage_ratio: float | None = None     # covered / total, None if no table
 
 
-async def score_spec(spec: Spec, *, strict: bool = True, audit: bool = False) -> SpecScore:
+async def score_spec(
+    spec: Spec, *, strict: bool = True, audit: bool = False, coverage: bool = True
+) -> SpecScore:
     """Check a spec and produce a quality score.
 
     Parameters
@@ -40,13 +43,19 @@ async def score_spec(spec: Spec, *, strict: bool = True, audit: bool = False) ->
         level diagnostics in the returned SpecScore.  Audit diagnostics are
         counted in warning_count but NEVER affect well_formed or health —
         they are informational only.
+    coverage:
+        If True (the default), match axioms against the obligation table and
+        fill in the coverage fields.  Pass False to skip the obligation table
+        build and axiom matching entirely; the coverage fields then keep their
+        zero / None defaults.
     """
     result = check_spec(spec)
 
-    # Only checker errors affect well-formedness and health.
-    error_count = len(result.errors)
-
-    from .check import Severity
+    # Tally severities in one pass per diagnostic source.  Only checker
+    # errors affect well-formedness and health, so error_count is read
+    # before the audit and coverage diagnostics are added.
+    severity_counts = Counter(d.severity for d in result.diagnostics)
+    error_count = severity_counts[Severity.ERROR]
 
     audit_diagnostics = audit_spec(spec) if audit else ()
 
@@ -58,7 +67,7 @@ async def score_spec(spec: Spec, *, strict: bool = True, audit: bool = False) ->
     unmatched_axiom_count = 0
     coverage_ratio: float | None = None
 
-    if spec.signature.generated_sorts:
+    if coverage and spec.signature.generated_sorts:
         from .axiom_match import match_spec
         from .obligation import build_obligation_table
 
@@ -91,13 +100,9 @@ async def score_spec(spec: Spec, *, strict: bool = True, audit: bool = False) ->
 
     # Checker warnings + audit WARNINGs + coverage WARNINGs count toward warning_count.
     # INFO-level diagnostics are excluded from the count.
-    audit_warnings = sum(
-        1 for d in audit_diagnostics if d.severity == Severity.WARNING
-    )
-    coverage_warnings = sum(
-        1 for d in coverage_diagnostics if d.severity == Severity.WARNING
-    )
-    warning_count = len(result.warnings) + audit_warnings + coverage_warnings
+    severity_counts.update(d.severity for d in audit_diagnostics)
+    severity_counts.update(d.severity for d in coverage_diagnostics)
+    warning_count = severity_counts[Severity.WARNING]
 
     if strict:
         health = 0.0 if error_count > 0 else 1.0
@@ -113,7 +118,7 @@ async def score_spec(spec: Spec, *, strict: bool = True, audit: bool = False) ->
 
     return SpecScore(
         spec_name=spec.name,
-        well_formed=result.is_well_formed,
+        well_formed=error_count == 0,
         error_count=error_count,
         warning_count=warning_count,
         health=health,
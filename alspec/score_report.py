@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import TextIO
@@ -8,7 +9,7 @@ from alspec.check import Severity
 from alspec.score import SpecScore
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreResult:
     """Outcome of loading and scoring a single spec file."""
 
@@ -30,8 +31,15 @@ class ScoreResult:
 
 def _short_path(path: str, max_len: int = 26) -> str:
     """Return a display-friendly (possibly truncated) relative path."""
+    return _short_path_from(path, os.getcwd(), max_len)
+
+
+@functools.lru_cache(maxsize=4096)
+def _short_path_from(path: str, cwd: str, max_len: int) -> str:
+    # Keyed on cwd so a directory change never serves a stale relative path;
+    # the table and the diagnostics listing shorten every path twice.
     try:
-        rel = os.path.relpath(path)
+        rel = os.path.relpath(path, cwd)
     except ValueError:
         rel = path
     if len(rel) > max_len:
@@ -39,18 +47,42 @@ def _short_path(path: str, max_len: int = 26) -> str:
     return rel
 
 
+# Score table templates, parsed once at import rather than per row.
+_TABLE_HEADER = (
+    "  File                       │ WF  │ Health │ Sorts │ Fns │ Preds │ Axioms │ Errs │ Warns │ Cov\n"
+)
+_TABLE_SEP = (
+    "  ─────────────────────────────┼─────┼────────┼───────┼─────┼───────┼────────┼──────┼───────┼────────\n"
+)
+_FAIL_ROW_FMT = (
+    "  {:<27}  │ ✗   │  FAIL  │   —   │  —  │   —   │   —    │   —  │   —   │ —\n"
+)
+_UNSCORED_ROW_FMT = (
+    "  {:<27}  │ ✓   │  —     │   —   │  —  │   —   │   —    │   —  │   —   │ —\n"
+)
+_ROW_FMT = (
+    "  {:<27}  │ {}   │ {:4.2f}   │ {:>4}  "
+    "│{:>3}  │  {:>3}  │   {:>3}  "
+    "│  {:>2}  │  {:>2}   │ {}\n"
+)
+_TOTAL_FMT = (
+    "  TOTALS ({}/{} loaded, {}/{} WF)  "
+    "│     │ {:4.2f}   │ {:>4}  "
+    "│{:>3}  │  {:>3}  │   {:>3}  "
+    "│  {:>2}  │  {:>2}   │ {}\n"
+)
+
+
 def print_score_table(results: list[ScoreResult], out: TextIO) -> None:
     """Print a summary table of scored spec files.
 
     Columns: File | WF | Health | Sorts | Fns | Preds | Axioms | Errs | Warns | Cov
     """
-    out.write("\n")
-    out.write(
-        "  File                       │ WF  │ Health │ Sorts │ Fns │ Preds │ Axioms │ Errs │ Warns │ Cov\n"
-    )
-    out.write(
-        "  ─────────────────────────────┼─────┼────────┼───────┼─────┼───────┼────────┼──────┼───────┼────────\n"
-    )
+    # Rows are collected and written to ``out`` in a single call.
+    buf: list[str] = []
+    buf.append("\n")
+    buf.append(_TABLE_HEADER)
+    buf.append(_TABLE_SEP)
 
     total_success = 0
     total_wf = 0
@@ -67,44 +99,48 @@ def print_score_table(results: list[ScoreResult], out: TextIO) -> None:
     for r in results:
         label = _short_path(r.file_path)
         if not r.success:
-            out.write(
-                f"  {label:<27}  │ ✗   │  FAIL  │   —   │  —  │   —   │   —    │   —  │   —   │ —\n"
-            )
+            buf.append(_FAIL_ROW_FMT.format(label))
             continue
 
         total_success += 1
-        match r.score:
-            case None:
-                out.write(
-                    f"  {label:<27}  │ ✓   │  —     │   —   │  —  │   —   │   —    │   —  │   —   │ —\n"
-                )
-            case score:
-                wf = "✓" if score.well_formed else "✗"
-                if score.well_formed:
-                    total_wf += 1
-                total_health += score.health
-                total_sorts += score.sort_count
-                total_fns += score.function_count
-                total_preds += score.predicate_count
-                total_axioms += score.axiom_count
-                total_errors += score.error_count
-                total_warnings += score.warning_count
-
-                cov_str = "—"
-                if score.obligation_cell_count > 0:
-                    cov_str = f"{score.covered_cell_count}/{score.obligation_cell_count}"
-                    total_covered += score.covered_cell_count
-                    total_cells += score.obligation_cell_count
-
-                out.write(
-                    f"  {label:<27}  │ {wf}   │ {score.health:4.2f}   │ {score.sort_count:>4}  "
-                    f"│{score.function_count:>3}  │  {score.predicate_count:>3}  │   {score.axiom_count:>3}  "
-                    f"│  {score.error_count:>2}  │  {score.warning_count:>2}   │ {cov_str}\n"
-                )
-
-    out.write(
-        "  ─────────────────────────────┼─────┼────────┼───────┼─────┼───────┼────────┼──────┼───────┼────────\n"
-    )
+        score = r.score
+        if score is None:
+            buf.append(_UNSCORED_ROW_FMT.format(label))
+            continue
+
+        wf = "✓" if score.well_formed else "✗"
+        if score.well_formed:
+            total_wf += 1
+        total_health += score.health
+        total_sorts += score.sort_count
+        total_fns += score.function_count
+        total_preds += score.predicate_count
+        total_axioms += score.axiom_count
+        total_errors += score.error_count
+        total_warnings += score.warning_count
+
+        cov_str = "—"
+        if score.obligation_cell_count > 0:
+            cov_str = f"{score.covered_cell_count}/{score.obligation_cell_count}"
+            total_covered += score.covered_cell_count
+            total_cells += score.obligation_cell_count
+
+        buf.append(
+            _ROW_FMT.format(
+                label,
+                wf,
+                score.health,
+                score.sort_count,
+                score.function_count,
+                score.predicate_count,
+                score.axiom_count,
+                score.error_count,
+                score.warning_count,
+                cov_str,
+            )
+        )
+
+    buf.append(_TABLE_SEP)
 
     n = len(results)
     mean_health = total_health / total_success if total_success else 0.0
@@ -112,46 +148,59 @@ def print_score_table(results: list[ScoreResult], out: TextIO) -> None:
     if total_cells > 0:
         total_cov_str = f"{total_covered}/{total_cells}"
 
-    out.write(
-        f"  TOTALS ({total_success}/{n} loaded, {total_wf}/{total_success or 1} WF)  "
-        f"│     │ {mean_health:4.2f}   │ {total_sorts:>4}  "
-        f"│{total_fns:>3}  │  {total_preds:>3}  │   {total_axioms:>3}  "
-        f"│  {total_errors:>2}  │  {total_warnings:>2}   │ {total_cov_str}\n"
+    buf.append(
+        _TOTAL_FMT.format(
+            total_success,
+            n,
+            total_wf,
+            total_success or 1,
+            mean_health,
+            total_sorts,
+            total_fns,
+            total_preds,
+            total_axioms,
+            total_errors,
+            total_warnings,
+            total_cov_str,
+        )
     )
 
     parse_pct = (total_success / n) * 100 if n else 0.0
     wf_pct = (total_wf / total_success) * 100 if total_success else 0.0
-    out.write(f"\n  Load rate:         {parse_pct:5.1f}%\n")
-    out.write(f"  Well-formed rate:  {wf_pct:5.1f}%\n")
-    out.write(f"  Mean health:       {mean_health:4.2f}\n")
+    buf.append(f"\n  Load rate:         {parse_pct:5.1f}%\n")
+    buf.append(f"  Well-formed rate:  {wf_pct:5.1f}%\n")
+    buf.append(f"  Mean health:       {mean_health:4.2f}\n")
     if total_cells > 0:
         mean_cov = (total_covered / total_cells) * 100
-        out.write(f"  Mean coverage:     {mean_cov:5.1f}%\n")
-    out.write("\n")
+        buf.append(f"  Mean coverage:     {mean_cov:5.1f}%\n")
+    buf.append("\n")
+    out.write("".join(buf))
+
+
+_SEVERITY_PREFIX: dict[Severity, str] = {
+    Severity.ERROR: "    ✗",
+    Severity.WARNING: "    ⚠",
+    Severity.INFO: "    ℹ",
+}
 
 
 def print_score_diagnostics(results: list[ScoreResult], out: TextIO) -> None:
     """Print a per-file diagnostic breakdown (errors, warnings, load failures)."""
-    out.write("  --- Diagnostics ---\n")
+    buf: list[str] = []
+    buf.append("  --- Diagnostics ---\n")
     for r in results:
         label = _short_path(r.file_path)
         if not r.success:
-            out.write(f"\n  {label}\n")
-            out.write(f"    ✗ {r.error}\n")
+            buf.append(f"\n  {label}\n")
+            buf.append(f"    ✗ {r.error}\n")
             continue
 
-        match r.score:
-            case None:
-                continue
-            case score:
-                if not score.diagnostics:
-                    continue
-                out.write(f"\n  {label}  (health: {score.health:.2f})\n")
-                for diag in score.diagnostics:
-                    if diag.severity == Severity.ERROR:
-                        out.write(f"    ✗ [{diag.check}] {diag.message}\n")
-                    elif diag.severity == Severity.WARNING:
-                        out.write(f"    ⚠ [{diag.check}] {diag.message}\n")
-                    else:
-                        out.write(f"    ℹ [{diag.check}] {diag.message}\n")
-    out.write("\n")
+        score = r.score
+        if score is None or not score.diagnostics:
+            continue
+        buf.append(f"\n  {label}  (health: {score.health:.2f})\n")
+        for diag in score.diagnostics:
+            prefix = _SEVERITY_PREFIX[diag.severity]
+            buf.append(f"{prefix} [{diag.check}] {diag.message}\n")
+    buf.append("\n")
+    out.write("".join(buf))
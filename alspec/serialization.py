@@ -7,7 +7,9 @@ Round-trip: from_json(to_json(x)) == x for all x.
 from __future__ import annotations
 
 import json
-from typing import Any
+import sys
+from collections.abc import Callable
+from typing import Any, TextIO
 
 from .signature import (
     FnParam,
@@ -51,39 +53,59 @@ from .terms import (
 # ---------------------------------------------------------------------------
 
 
+def _sref(name: str) -> SortRef:
+    """Decode a sort name, interned so repeated occurrences share one string.
+
+    ``SortRef`` is a ``NewType`` over ``str``, so the decoded JSON string is
+    the only allocation; interning folds the hundreds of equal sort names in
+    a large spec into one object each.
+    """
+    return SortRef(sys.intern(name))
+
+
+_SORT_ENCODERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    AtomicSort: lambda s: {"type": "atomic", "name": s.name},
+    ProductSort: lambda s: {
+        "type": "product",
+        "name": s.name,
+        "fields": [{"name": f.name, "sort": f.sort} for f in s.fields],
+    },
+    CoproductSort: lambda s: {
+        "type": "coproduct",
+        "name": s.name,
+        "alts": [{"tag": a.tag, "sort": a.sort} for a in s.alts],
+    },
+}
+
+_SORT_DECODERS: dict[str, Callable[[dict[str, Any]], SortDecl]] = {
+    "atomic": lambda d: AtomicSort(name=_sref(d["name"])),
+    "product": lambda d: ProductSort(
+        name=_sref(d["name"]),
+        fields=tuple(
+            ProductField(name=f["name"], sort=_sref(f["sort"])) for f in d["fields"]
+        ),
+    ),
+    "coproduct": lambda d: CoproductSort(
+        name=_sref(d["name"]),
+        alts=tuple(
+            CoproductAlt(tag=a["tag"], sort=_sref(a["sort"])) for a in d["alts"]
+        ),
+    ),
+}
+
+
 def sort_to_json(s: SortDecl) -> dict[str, Any]:
-    if isinstance(s, AtomicSort):
-        return {"type": "atomic", "name": s.name}
-    elif isinstance(s, ProductSort):
-        return {
-            "type": "product",
-            "name": s.name,
-            "fields": [{"name": f.name, "sort": f.sort} for f in s.fields],
-        }
-    elif isinstance(s, CoproductSort):
-        return {
-            "type": "coproduct",
-            "name": s.name,
-            "alts": [{"tag": a.tag, "sort": a.sort} for a in s.alts],
-        }
-    raise TypeError(f"Unknown sort type: {type(s)}")
+    encode = _SORT_ENCODERS.get(type(s))
+    if encode is None:
+        raise TypeError(f"Unknown sort type: {type(s)}")
+    return encode(s)
 
 
 def sort_from_json(d: dict[str, Any]) -> SortDecl:
-    t = d["type"]
-    if t == "atomic":
-        return AtomicSort(name=SortRef(d["name"]))
-    elif t == "product":
-        fields = tuple(
-            ProductField(name=f["name"], sort=SortRef(f["sort"])) for f in d["fields"]
-        )
-        return ProductSort(name=SortRef(d["name"]), fields=fields)
-    elif t == "coproduct":
-        alts = tuple(
-            CoproductAlt(tag=a["tag"], sort=SortRef(a["sort"])) for a in d["alts"]
-        )
-        return CoproductSort(name=SortRef(d["name"]), alts=alts)
-    raise ValueError(f"Unknown sort type: {t}")
+    decode = _SORT_DECODERS.get(d["type"])
+    if decode is None:
+        raise ValueError(f"Unknown sort type: {d['type']}")
+    return decode(d)
 
 
 # ---------------------------------------------------------------------------
@@ -103,12 +125,12 @@ def fn_symbol_to_json(f: FnSymbol) -> dict[str, Any]:
 
 def fn_symbol_from_json(d: dict[str, Any]) -> FnSymbol:
     params = tuple(
-        FnParam(name=p["name"], sort=SortRef(p["sort"])) for p in d["params"]
+        FnParam(name=p["name"], sort=_sref(p["sort"])) for p in d["params"]
     )
     return FnSymbol(
         name=d["name"],
         params=params,
-        result=SortRef(d["result"]),
+        result=_sref(d["result"]),
         totality=Totality(d["totality"]),
     )
 
@@ -123,7 +145,7 @@ def pred_symbol_to_json(p: PredSymbol) -> dict[str, Any]:
 
 def pred_symbol_from_json(d: dict[str, Any]) -> PredSymbol:
     params = tuple(
-        FnParam(name=p["name"], sort=SortRef(p["sort"])) for p in d["params"]
+        FnParam(name=p["name"], sort=_sref(p["sort"])) for p in d["params"]
     )
     return PredSymbol(name=d["name"], params=params)
 
@@ -173,42 +195,169 @@ def signature_from_json(d: dict[str, Any]) -> Signature:
 
 
 # ---------------------------------------------------------------------------
-# Terms
+# Term / formula encoding
 # ---------------------------------------------------------------------------
+#
+# Terms and formulas are encoded by one iterative post-order walk rather than
+# mutual recursion: each node is visited twice on an explicit stack, first to
+# push its children and then to assemble its dict from the children's
+# already-encoded dicts.  ``_TERM_ENCODERS`` and ``_FORMULA_ENCODERS`` hold,
+# per node type, the term children and formula children to visit and the
+# builder that receives their encodings in that order (terms first).  A child
+# is looked up only in the table for its position, so a term where a formula
+# belongs (or vice versa) is rejected rather than encoded.
+
+type _Node = Term | Formula
+type _Children = tuple[tuple[Term, ...], tuple[Formula, ...]]
+type _Encoder = tuple[
+    Callable[[Any], _Children],
+    Callable[[Any, list[dict[str, Any]]], dict[str, Any]],
+]
+
+_NO_CHILDREN: _Children = ((), ())
+
+_TERM_ENCODERS: dict[type, _Encoder] = {
+    Var: (
+        lambda t: _NO_CHILDREN,
+        lambda t, kids: {"type": "var", "name": t.name, "sort": t.sort},
+    ),
+    FnApp: (
+        lambda t: (t.args, ()),
+        lambda t, kids: {"type": "fn_app", "fn_name": t.fn_name, "args": kids},
+    ),
+    FieldAccess: (
+        lambda t: ((t.term,), ()),
+        lambda t, kids: {
+            "type": "field_access",
+            "term": kids[0],
+            "field_name": t.field_name,
+        },
+    ),
+    Literal: (
+        lambda t: _NO_CHILDREN,
+        lambda t, kids: {"type": "literal", "value": t.value, "sort": t.sort},
+    ),
+}
+
+_FORMULA_ENCODERS: dict[type, _Encoder] = {
+    Equation: (
+        lambda f: ((f.lhs, f.rhs), ()),
+        lambda f, kids: {"type": "equation", "lhs": kids[0], "rhs": kids[1]},
+    ),
+    PredApp: (
+        lambda f: (f.args, ()),
+        lambda f, kids: {"type": "pred_app", "pred_name": f.pred_name, "args": kids},
+    ),
+    Negation: (
+        lambda f: ((), (f.formula,)),
+        lambda f, kids: {"type": "negation", "formula": kids[0]},
+    ),
+    Conjunction: (
+        lambda f: ((), f.conjuncts),
+        lambda f, kids: {"type": "conjunction", "conjuncts": kids},
+    ),
+    Disjunction: (
+        lambda f: ((), f.disjuncts),
+        lambda f, kids: {"type": "disjunction", "disjuncts": kids},
+    ),
+    Implication: (
+        lambda f: ((), (f.antecedent, f.consequent)),
+        lambda f, kids: {
+            "type": "implication",
+            "antecedent": kids[0],
+            "consequent": kids[1],
+        },
+    ),
+    Biconditional: (
+        lambda f: ((), (f.lhs, f.rhs)),
+        lambda f, kids: {"type": "biconditional", "lhs": kids[0], "rhs": kids[1]},
+    ),
+    UniversalQuant: (
+        lambda f: (f.variables, (f.body,)),
+        lambda f, kids: {"type": "forall", "variables": kids[:-1], "body": kids[-1]},
+    ),
+    ExistentialQuant: (
+        lambda f: (f.variables, (f.body,)),
+        lambda f, kids: {"type": "exists", "variables": kids[:-1], "body": kids[-1]},
+    ),
+    Definedness: (
+        lambda f: ((f.term,), ()),
+        lambda f, kids: {"type": "definedness", "term": kids[0]},
+    ),
+}
+
+
+def _encode(
+    root: _Node,
+    encoders: dict[type, _Encoder],
+    memo: dict[int, dict[str, Any]],
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    # (node, table for its position, number of children) — the count is None
+    # until the node has been expanded.
+    todo: list[tuple[_Node, dict[type, _Encoder], int | None]] = [
+        (root, encoders, None)
+    ]
+    while todo:
+        node, table, n = todo.pop()
+        encoder = table.get(type(node))
+        if encoder is None:
+            kind = "term" if table is _TERM_ENCODERS else "formula"
+            raise TypeError(f"Unknown {kind} type: {type(node)}")
+        get_children, build = encoder
+        if n is None:
+            # Nodes are immutable, so an object shared between several
+            # places in the tree (a reused Var, a common constant) is
+            # encoded once and its dict reused.
+            cached = memo.get(id(node))
+            if cached is not None:
+                results.append(cached)
+                continue
+            terms, formulas = get_children(node)
+            todo.append((node, table, len(terms) + len(formulas)))
+            todo.extend((f, _FORMULA_ENCODERS, None) for f in reversed(formulas))
+            todo.extend((t, _TERM_ENCODERS, None) for t in reversed(terms))
+            continue
+        if n:
+            kids = results[-n:]
+            del results[-n:]
+        else:
+            kids = []
+        encoded = memo[id(node)] = build(node, kids)
+        results.append(encoded)
+    return results[0]
 
 
 def term_to_json(t: Term) -> dict[str, Any]:
-    if isinstance(t, Var):
-        return {"type": "var", "name": t.name, "sort": t.sort}
-    elif isinstance(t, FnApp):
-        return {
-            "type": "fn_app",
-            "fn_name": t.fn_name,
-            "args": [term_to_json(a) for a in t.args],
-        }
-    elif isinstance(t, FieldAccess):
-        return {
-            "type": "field_access",
-            "term": term_to_json(t.term),
-            "field_name": t.field_name,
-        }
-    elif isinstance(t, Literal):
-        return {"type": "literal", "value": t.value, "sort": t.sort}
-    raise TypeError(f"Unknown term type: {type(t)}")
+    return _encode(t, _TERM_ENCODERS, {})
+
+
+def formula_to_json(f: Formula) -> dict[str, Any]:
+    return _encode(f, _FORMULA_ENCODERS, {})
+
+
+# ---------------------------------------------------------------------------
+# Terms
+# ---------------------------------------------------------------------------
+
+
+_TERM_DECODERS: dict[str, Callable[[dict[str, Any]], Term]] = {
+    "var": lambda d: Var(name=d["name"], sort=_sref(d["sort"])),
+    "fn_app": lambda d: FnApp(
+        fn_name=d["fn_name"], args=tuple(term_from_json(a) for a in d["args"])
+    ),
+    "field_access": lambda d: FieldAccess(
+        term=term_from_json(d["term"]), field_name=d["field_name"]
+    ),
+    "literal": lambda d: Literal(value=d["value"], sort=_sref(d["sort"])),
+}
 
 
 def term_from_json(d: dict[str, Any]) -> Term:
-    t = d["type"]
-    if t == "var":
-        return Var(name=d["name"], sort=SortRef(d["sort"]))
-    elif t == "fn_app":
-        args = tuple(term_from_json(a) for a in d["args"])
-        return FnApp(fn_name=d["fn_name"], args=args)
-    elif t == "field_access":
-        return FieldAccess(term=term_from_json(d["term"]), field_name=d["field_name"])
-    elif t == "literal":
-        return Literal(value=d["value"], sort=SortRef(d["sort"]))
-    raise ValueError(f"Unknown term type: {t}")
+    decode = _TERM_DECODERS.get(d["type"])
+    if decode is None:
+        raise ValueError(f"Unknown term type: {d['type']}")
+    return decode(d)
 
 
 # ---------------------------------------------------------------------------
@@ -216,104 +365,51 @@ def term_from_json(d: dict[str, Any]) -> Term:
 # ---------------------------------------------------------------------------
 
 
-def formula_to_json(f: Formula) -> dict[str, Any]:
-    if isinstance(f, Equation):
-        return {
-            "type": "equation",
-            "lhs": term_to_json(f.lhs),
-            "rhs": term_to_json(f.rhs),
-        }
-    elif isinstance(f, PredApp):
-        return {
-            "type": "pred_app",
-            "pred_name": f.pred_name,
-            "args": [term_to_json(a) for a in f.args],
-        }
-    elif isinstance(f, Negation):
-        return {"type": "negation", "formula": formula_to_json(f.formula)}
-    elif isinstance(f, Conjunction):
-        return {
-            "type": "conjunction",
-            "conjuncts": [formula_to_json(c) for c in f.conjuncts],
-        }
-    elif isinstance(f, Disjunction):
-        return {
-            "type": "disjunction",
-            "disjuncts": [formula_to_json(d) for d in f.disjuncts],
-        }
-    elif isinstance(f, Implication):
-        return {
-            "type": "implication",
-            "antecedent": formula_to_json(f.antecedent),
-            "consequent": formula_to_json(f.consequent),
-        }
-    elif isinstance(f, Biconditional):
-        return {
-            "type": "biconditional",
-            "lhs": formula_to_json(f.lhs),
-            "rhs": formula_to_json(f.rhs),
-        }
-    elif isinstance(f, UniversalQuant):
-        return {
-            "type": "forall",
-            "variables": [term_to_json(v) for v in f.variables],
-            "body": formula_to_json(f.body),
-        }
-    elif isinstance(f, ExistentialQuant):
-        return {
-            "type": "exists",
-            "variables": [term_to_json(v) for v in f.variables],
-            "body": formula_to_json(f.body),
-        }
-    elif isinstance(f, Definedness):
-        return {"type": "definedness", "term": term_to_json(f.term)}
-    raise TypeError(f"Unknown formula type: {type(f)}")
+def _vars_from_json(ds: list[dict[str, Any]]) -> tuple[Var, ...]:
+    variables = tuple(term_from_json(v) for v in ds)
+    assert all(isinstance(v, Var) for v in variables)
+    return variables  # type: ignore[return-value]
+
+
+_FORMULA_DECODERS: dict[str, Callable[[dict[str, Any]], Formula]] = {
+    "equation": lambda d: Equation(
+        lhs=term_from_json(d["lhs"]), rhs=term_from_json(d["rhs"])
+    ),
+    "pred_app": lambda d: PredApp(
+        pred_name=d["pred_name"], args=tuple(term_from_json(a) for a in d["args"])
+    ),
+    "negation": lambda d: Negation(formula=formula_from_json(d["formula"])),
+    "conjunction": lambda d: Conjunction(
+        conjuncts=tuple(formula_from_json(c) for c in d["conjuncts"])
+    ),
+    "disjunction": lambda d: Disjunction(
+        disjuncts=tuple(formula_from_json(dd) for dd in d["disjuncts"])
+    ),
+    "implication": lambda d: Implication(
+        antecedent=formula_from_json(d["antecedent"]),
+        consequent=formula_from_json(d["consequent"]),
+    ),
+    "biconditional": lambda d: Biconditional(
+        lhs=formula_from_json(d["lhs"]),
+        rhs=formula_from_json(d["rhs"]),
+    ),
+    "forall": lambda d: UniversalQuant(
+        variables=_vars_from_json(d["variables"]),
+        body=formula_from_json(d["body"]),
+    ),
+    "exists": lambda d: ExistentialQuant(
+        variables=_vars_from_json(d["variables"]),
+        body=formula_from_json(d["body"]),
+    ),
+    "definedness": lambda d: Definedness(term=term_from_json(d["term"])),
+}
 
 
 def formula_from_json(d: dict[str, Any]) -> Formula:
-    t = d["type"]
-    if t == "equation":
-        return Equation(lhs=term_from_json(d["lhs"]), rhs=term_from_json(d["rhs"]))
-    elif t == "pred_app":
-        args = tuple(term_from_json(a) for a in d["args"])
-        return PredApp(pred_name=d["pred_name"], args=args)
-    elif t == "negation":
-        return Negation(formula=formula_from_json(d["formula"]))
-    elif t == "conjunction":
-        return Conjunction(
-            conjuncts=tuple(formula_from_json(c) for c in d["conjuncts"])
-        )
-    elif t == "disjunction":
-        return Disjunction(
-            disjuncts=tuple(formula_from_json(dd) for dd in d["disjuncts"])
-        )
-    elif t == "implication":
-        return Implication(
-            antecedent=formula_from_json(d["antecedent"]),
-            consequent=formula_from_json(d["consequent"]),
-        )
-    elif t == "biconditional":
-        return Biconditional(
-            lhs=formula_from_json(d["lhs"]),
-            rhs=formula_from_json(d["rhs"]),
-        )
-    elif t == "forall":
-        variables = tuple(term_from_json(v) for v in d["variables"])
-        assert all(isinstance(v, Var) for v in variables)
-        return UniversalQuant(
-            variables=variables,  # type: ignore[arg-type]
-            body=formula_from_json(d["body"]),
-        )
-    elif t == "exists":
-        variables = tuple(term_from_json(v) for v in d["variables"])
-        assert all(isinstance(v, Var) for v in variables)
-        return ExistentialQuant(
-            variables=variables,  # type: ignore[arg-type]
-            body=formula_from_json(d["body"]),
-        )
-    elif t == "definedness":
-        return Definedness(term=term_from_json(d["term"]))
-    raise ValueError(f"Unknown formula type: {t}")
+    decode = _FORMULA_DECODERS.get(d["type"])
+    if decode is None:
+        raise ValueError(f"Unknown formula type: {d['type']}")
+    return decode(d)
 
 
 # ---------------------------------------------------------------------------
@@ -322,12 +418,16 @@ def formula_from_json(d: dict[str, Any]) -> Formula:
 
 
 def spec_to_json(sp: Spec) -> dict[str, Any]:
+    # One memo for the whole spec: sub-terms shared across axioms are
+    # encoded once.  The returned dicts may therefore alias each other.
+    memo: dict[int, dict[str, Any]] = {}
     return {
         "type": "spec",
         "name": sp.name,
         "signature": signature_to_json(sp.signature),
         "axioms": [
-            {"label": a.label, "formula": formula_to_json(a.formula)} for a in sp.axioms
+            {"label": a.label, "formula": _encode(a.formula, _FORMULA_ENCODERS, memo)}
+            for a in sp.axioms
         ],
     }
 
@@ -345,7 +445,7 @@ def spec_from_json(d: dict[str, Any]) -> Spec:
 
 
 # ---------------------------------------------------------------------------
-# Convenience: dump / load entire specs as JSON strings
+# Convenience: dump / load entire specs as JSON strings or files
 # ---------------------------------------------------------------------------
 
 
@@ -355,3 +455,12 @@ def dumps(sp: Spec) -> str:
 
 def loads(s: str) -> Spec:
     return spec_from_json(json.loads(s))
+
+
+def dump(sp: Spec, fp: TextIO) -> None:
+    """Write *sp* as JSON to a text file without building the string first."""
+    json.dump(spec_to_json(sp), fp, indent=2)
+
+
+def load(fp: TextIO) -> Spec:
+    return spec_from_json(json.load(fp))
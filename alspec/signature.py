@@ -20,6 +20,7 @@ from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from types import MappingProxyType
+from typing import Any
 
 from .sorts import SortDecl, SortRef
 
@@ -33,7 +34,7 @@ class Totality(Enum):
     PARTIAL = "partial"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FnParam:
     """A named parameter of a function symbol."""
 
@@ -41,7 +42,7 @@ class FnParam:
     sort: SortRef
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FnSymbol:
     """A function symbol with a profile.
 
@@ -64,14 +65,14 @@ class FnSymbol:
 
     @property
     def param_sorts(self) -> tuple[SortRef, ...]:
-        return tuple(p.sort for p in self.params)
+        return tuple([p.sort for p in self.params])
 
     @property
     def is_constant(self) -> bool:
         return self.arity == 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PredSymbol:
     """A predicate symbol (function returning truth value).
 
@@ -93,7 +94,7 @@ class PredSymbol:
 
     @property
     def param_sorts(self) -> tuple[SortRef, ...]:
-        return tuple(p.sort for p in self.params)
+        return tuple([p.sort for p in self.params])
 
 
 # ---------------------------------------------------------------------------
@@ -101,7 +102,7 @@ class PredSymbol:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeneratedSortInfo:
     """Declaration of a generated sort with its constructors and selectors.
 
@@ -137,10 +138,13 @@ class GeneratedSortInfo:
 # Signature
 # ---------------------------------------------------------------------------
 
-_EMPTY_GENERATED_SORTS: Mapping[str, GeneratedSortInfo] = MappingProxyType({})
+# One shared read-only empty table; every empty symbol table points here.
+_EMPTY_TABLE: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_GENERATED_SORTS: Mapping[str, GeneratedSortInfo] = _EMPTY_TABLE
+_TABLE_NAMES = ("sorts", "functions", "predicates", "generated_sorts")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signature:
     """A many-sorted signature Σ = (S, F, P).
 
@@ -159,7 +163,17 @@ class Signature:
     generated_sorts: Mapping[str, GeneratedSortInfo] = _EMPTY_GENERATED_SORTS
 
     def __post_init__(self) -> None:
-        """Validate selector param names against constructor param lists."""
+        """Take read-only copies of the symbol tables, then validate selectors.
+
+        Callers usually pass plain dicts; copying them into read-only
+        proxies means the validated signature can't be changed afterwards
+        through the caller's references.
+        """
+        for name in _TABLE_NAMES:
+            table = getattr(self, name)
+            if table is not _EMPTY_TABLE:
+                owned = MappingProxyType(dict(table)) if table else _EMPTY_TABLE
+                object.__setattr__(self, name, owned)
         for sort_name, info in self.generated_sorts.items():
             for ctor_name, sel_map in info.selectors.items():
                 if ctor_name not in self.functions:
@@ -177,6 +191,16 @@ class Signature:
                             f"{sorted(ctor_param_names)}"
                         )
 
+    def __getstate__(self) -> tuple[dict[str, Any], ...]:
+        # Read-only proxies can't be pickled or deep-copied; hand out plain
+        # dicts and wrap them again in __setstate__.
+        return tuple([dict(getattr(self, name)) for name in _TABLE_NAMES])
+
+    def __setstate__(self, state: tuple[dict[str, Any], ...]) -> None:
+        for name, table in zip(_TABLE_NAMES, state, strict=True):
+            owned = MappingProxyType(table) if table else _EMPTY_TABLE
+            object.__setattr__(self, name, owned)
+
     def get_sort(self, name: str) -> SortDecl | None:
         return self.sorts.get(name)
 
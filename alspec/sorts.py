@@ -35,7 +35,7 @@ class SortKind(Enum):
     COPRODUCT = "coproduct"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtomicSort:
     """An opaque sort with no internal structure.
 
@@ -49,7 +49,7 @@ class AtomicSort:
         return SortKind.ATOMIC
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProductField:
     """A named, typed field in a product sort."""
 
@@ -57,8 +57,15 @@ class ProductField:
     sort: SortRef
 
 
-@dataclass(frozen=True)
-class ProductSort:
+class _FieldSortSlot:
+    """Private slot for ProductSort's field lookup, kept out of its fields."""
+
+    __slots__ = ("_field_sorts",)
+    _field_sorts: dict[str, SortRef]
+
+
+@dataclass(frozen=True, slots=True)
+class ProductSort(_FieldSortSlot):
     """A sort with named fields (record / struct).
 
     Example:
@@ -76,24 +83,28 @@ class ProductSort:
         return SortKind.PRODUCT
 
     def field_sort(self, field_name: str) -> SortRef | None:
-        """Look up the sort of a field by name. Returns None if not found.
-
-        Guards against malformed entries (e.g. raw tuples from LLM-generated
-        code executed via exec that bypasses the dataclass constructor).
-        """
-        for f in self.fields:
-            if not isinstance(f, ProductField):
-                continue
-            if f.name == field_name:
-                return f.sort
-        return None
+        """Look up the sort of a field by name. Returns None if not found."""
+        try:
+            field_sorts = self._field_sorts
+        except AttributeError:
+            # Built on first lookup (also after copy/unpickle, which restore
+            # only the dataclass fields). Skips malformed entries (e.g. raw
+            # tuples from LLM-generated code executed via exec that bypasses
+            # the dataclass constructor); the first field with a given name
+            # wins, as in a linear scan.
+            field_sorts = {}
+            for f in self.fields:
+                if isinstance(f, ProductField):
+                    field_sorts.setdefault(f.name, f.sort)
+            object.__setattr__(self, "_field_sorts", field_sorts)
+        return field_sorts.get(field_name)
 
     @property
     def field_names(self) -> tuple[str, ...]:
-        return tuple(f.name for f in self.fields if isinstance(f, ProductField))
+        return tuple([f.name for f in self.fields if isinstance(f, ProductField)])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoproductAlt:
     """A tagged alternative in a coproduct sort."""
 
@@ -101,7 +112,7 @@ class CoproductAlt:
     sort: SortRef
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoproductSort:
     """A sort that is one of several tagged alternatives (sum type).
 
@@ -121,7 +132,7 @@ class CoproductSort:
 
     @property
     def tags(self) -> tuple[str, ...]:
-        return tuple(a.tag for a in self.alts)
+        return tuple([a.tag for a in self.alts])
 
 
 # Union type for any sort declaration
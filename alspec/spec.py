@@ -15,7 +15,7 @@ from .signature import Signature
 from .terms import Formula
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Axiom:
     """A named axiom."""
 
@@ -23,7 +23,7 @@ class Axiom:
     formula: Formula
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Spec:
     """A named specification.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import time
 import logging
 from abc import ABC, abstractmethod
@@ -89,11 +90,18 @@ class AxiomOutput:
     usage: UsageInfo | None
 
 
-def _execute_signature_code(code: str) -> Signature | str:
-    """Execute Stage 2 code and extract a Signature."""
+@functools.cache
+def _exec_base_namespace() -> dict[str, Any]:
+    """Namespace with the DSL star-imports applied, built once per process."""
     namespace: dict[str, Any] = {}
     exec("from alspec import *", namespace)
     exec("from alspec.helpers import *", namespace)
+    return namespace
+
+
+def _execute_signature_code(code: str) -> Signature | str:
+    """Execute Stage 2 code and extract a Signature."""
+    namespace = dict(_exec_base_namespace())
 
     try:
         exec(code, namespace)
@@ -122,9 +130,7 @@ def _execute_signature_code(code: str) -> Signature | str:
 
 def _execute_spec_code(code: str) -> Spec | str:
     """Execute Stage 4 code and extract the top-level `spec` variable."""
-    namespace: dict[str, Any] = {}
-    exec("from alspec import *", namespace)
-    exec("from alspec.helpers import *", namespace)
+    namespace = dict(_exec_base_namespace())
 
     try:
         exec(code, namespace)
@@ -20,7 +20,7 @@ from .sorts import SortRef
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Var:
     """A variable with a declared sort.
 
@@ -31,7 +31,7 @@ class Var:
     sort: SortRef
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FnApp:
     """Application of a function symbol to arguments.
 
@@ -44,7 +44,7 @@ class FnApp:
     args: tuple[Term, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldAccess:
     """Access a named field on a product-sorted term.
 
@@ -55,7 +55,7 @@ class FieldAccess:
     field_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Literal:
     """A concrete literal value of a known sort.
 
@@ -72,16 +72,13 @@ class Literal:
 # Union of all term forms
 Term = Var | FnApp | FieldAccess | Literal
 
-# Python needs this for frozen dataclass forward refs
-FnApp.__pydantic_model__ = None  # type: ignore[attr-defined]
-
 
 # ---------------------------------------------------------------------------
 # Formulas — for axioms / equations
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Equation:
     """An equation between two terms of the same sort.
 
@@ -97,7 +94,7 @@ class Equation:
     rhs: Term
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PredApp:
     """Application of a predicate to arguments.
 
@@ -109,7 +106,7 @@ class PredApp:
     args: tuple[Term, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Negation:
     """Logical negation of a formula.
 
@@ -119,7 +116,7 @@ class Negation:
     formula: Formula
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Conjunction:
     """Logical AND of formulas.
 
@@ -129,7 +126,7 @@ class Conjunction:
     conjuncts: tuple[Formula, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Disjunction:
     """Logical OR of formulas.
 
@@ -139,7 +136,7 @@ class Disjunction:
     disjuncts: tuple[Formula, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Implication:
     """Logical implication.
 
@@ -150,7 +147,7 @@ class Implication:
     consequent: Formula
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Biconditional:
     """Logical biconditional (if and only if).
 
@@ -167,7 +164,7 @@ class Biconditional:
     rhs: Formula
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UniversalQuant:
     """Universal quantification over variables.
 
@@ -178,7 +175,7 @@ class UniversalQuant:
     body: Formula
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExistentialQuant:
     """Existential quantification over variables.
 
@@ -189,7 +186,7 @@ class ExistentialQuant:
     body: Formula
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Definedness:
     """Definedness assertion for a term (relevant for partial functions).
 
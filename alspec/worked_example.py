@@ -7,7 +7,7 @@ markdown + code regardless of which example is being shown.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 
@@ -299,6 +299,11 @@ def _strip_comments(code: str) -> str:
     return "\n".join(result)
 
 
+def _python_fence(code: str) -> str:
+    """Wrap code in a ```python fenced block (one join, no line appends)."""
+    return "".join(("```python\n", code, "\n```"))
+
+
 # ============================================================
 # WorkedExample
 # ============================================================
@@ -334,6 +339,12 @@ class WorkedExample:
     fills_constructor_terms: tuple[dict[str, str], ...] = ()  # [{"name": "_zone_add_record", "expression": "app(\"add_record\", z, n, t, d, ttl)"}, ...]
     fills_entries: tuple[dict[str, str], ...] = ()    # [{"label": "...", "formula": "..."}, ...]
 
+    # Rendered text per (mode, include_table); examples are immutable, so
+    # every prompt build after the first reuses the same string.
+    _rendered: dict[tuple[RenderMode, bool], str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def render(
         self,
         mode: RenderMode = RenderMode.FULL,
@@ -350,6 +361,14 @@ class WorkedExample:
             If False, omit the obligation table from the analysis section.
             Only relevant when mode includes analysis (FULL or ANALYSIS).
         """
+        key = (mode, include_table)
+        text = self._rendered.get(key)
+        if text is None:
+            text = self._render(mode, include_table=include_table)
+            self._rendered[key] = text
+        return text
+
+    def _render(self, mode: RenderMode, *, include_table: bool) -> str:
         parts: list[str] = []
 
         parts.append(f"---\n\n#### Worked Example: {self.domain_name}")
@@ -366,19 +385,13 @@ class WorkedExample:
 
         if mode == RenderMode.SIGNATURE:
             code = _extract_signature_only(self.code)
-            parts.append("```python")
-            parts.append(code)
-            parts.append("```")
+            parts.append(_python_fence(code))
         elif mode == RenderMode.SPEC:
             code = _unwrap_function(self.code)
-            parts.append("```python")
-            parts.append(code)
-            parts.append("```")
+            parts.append(_python_fence(code))
         elif mode in (RenderMode.FULL, RenderMode.CODE, RenderMode.CODE_BARE):
             code = self.code if mode != RenderMode.CODE_BARE else _strip_comments(self.code)
-            parts.append("```python")
-            parts.append(code)
-            parts.append("```")
+            parts.append(_python_fence(code))
         elif mode == RenderMode.FILLS:
             # Constructor terms section
             if self.fills_constructor_terms:
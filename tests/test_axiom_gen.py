@@ -986,3 +986,27 @@ class TestApproachB:
                 remaining_section = prompt.split("Remaining axiom obligations")[1]
                 # top(push(s, e)) should be mechanical (SELECTOR_EXTRACT)
                 assert "top(push(s, e))" not in remaining_section
+
+    def test_sort_without_observers_renders_one_line(self):
+        """A generated sort with no observers collapses to its header plus a note."""
+        from alspec.obligation_render import render_obligation_prompt
+
+        sig = Signature(
+            sorts={"Token": atomic("Token")},
+            functions={
+                "fresh": FnSymbol("fresh", params=(), result="Token"),
+                "next": FnSymbol("next", params=(param("t", "Token"),), result="Token"),
+            },
+            predicates={},
+            generated_sorts={
+                "Token": GeneratedSortInfo(constructors=("fresh", "next"), selectors={}),
+            },
+        )
+        table = build_obligation_table(sig)
+        report = generate_mechanical_axioms(sig, table)
+        prompt = render_obligation_prompt(sig, table, report)
+
+        assert prompt.startswith("## Sort: Token")
+        assert "no axiom obligations" in prompt
+        assert "Mechanical axioms" not in prompt
+        assert "**Constructors:**" not in prompt
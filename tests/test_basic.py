@@ -1,4 +1,11 @@
-from alspec import AtomicSort, SortRef
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from alspec import AtomicSort, Err, Ok, ProductField, ProductSort, Signature, SortRef
+from alspec.helpers import atomic, fn
 
 
 def test_atomic_sort() -> None:
@@ -7,6 +14,56 @@ def test_atomic_sort() -> None:
     assert s.kind.value == "atomic"
 
 
+def test_signature_owns_read_only_tables() -> None:
+    functions = {"zero": fn("zero", [], "Nat")}
+    sig = Signature(sorts={"Nat": atomic("Nat")}, functions=functions, predicates={})
+    functions["one"] = fn("one", [], "Nat")
+    assert set(sig.functions) == {"zero"}
+    with pytest.raises(TypeError):
+        sig.functions["two"] = fn("two", [], "Nat")  # type: ignore[index]
+    assert sig == Signature(
+        sorts={"Nat": atomic("Nat")},
+        functions={"zero": fn("zero", [], "Nat")},
+        predicates={},
+    )
+
+
+def test_signature_and_spec_copy_and_pickle() -> None:
+    from alspec.basis import ALL_BASIS_SPECS
+
+    for spec_fn in ALL_BASIS_SPECS:
+        sp = spec_fn()
+        for restored in (copy.deepcopy(sp), pickle.loads(pickle.dumps(sp))):
+            assert restored == sp
+            with pytest.raises(TypeError):
+                restored.signature.sorts["X"] = atomic("X")  # type: ignore[index]
+    empty = Signature(sorts={}, functions={}, predicates={})
+    assert pickle.loads(pickle.dumps(empty)) == empty
+
+
+def test_product_field_sort_lookup() -> None:
+    pair = ProductSort(
+        name=SortRef("Pair"),
+        fields=(
+            ProductField("fst", SortRef("Nat")),
+            ("raw", "tuple"),  # type: ignore[arg-type]
+            ProductField("snd", SortRef("Bool")),
+        ),
+    )
+    assert pair.field_sort("fst") == "Nat"
+    assert pair.field_sort("snd") == "Bool"
+    assert pair.field_sort("raw") is None
+    assert pair.field_sort("missing") is None
+    assert [f.name for f in dataclasses.fields(pair)] == ["name", "fields"]
+    assert copy.deepcopy(pair).field_sort("snd") == "Bool"
+
+
+def test_result_subscripted_construction() -> None:
+    assert Ok[int](1).value == 1
+    err = ValueError("boom")
+    assert Err[ValueError](err).error is err
+
+
 if __name__ == "__main__":
     test_atomic_sort()
     print("Basic test passed!")
@@ -0,0 +1,11 @@
+from alspec.lenses import load_sources
+
+
+def test_load_sources_rereads_when_file_changes(tmp_path):
+    src = tmp_path / "domain.txt"
+    src.write_text("first")
+    assert load_sources("unused", extra_sources=[src]).endswith("first")
+
+    # Rewritten straight away, typically within the same mtime tick.
+    src.write_text("second")
+    assert load_sources("unused", extra_sources=[src]).endswith("second")
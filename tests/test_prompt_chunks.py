@@ -30,6 +30,10 @@ class TestRegistry:
                 get_chunk(ChunkId.ROLE_PREAMBLE)
         finally:
             _REGISTRY[ChunkId.ROLE_PREAMBLE] = saved
+
+    def test_chunk_render_is_memoized(self):
+        chunk = get_chunk(ChunkId.TYPE_GRAMMAR)
+        assert chunk.render() is chunk.render()
     
     def test_chunks_for_signature(self):
         """SIGNATURE chunks include SIG_AX and SIG, exclude AX-only."""
@@ -187,6 +191,15 @@ class TestChunkContent:
         assert "submit_axiom_fills(" in content
         assert "def dns_zone_spec" not in content
 
+    def test_worked_example_render_is_memoized(self):
+        from alspec.reference.worked_examples import ALL_EXAMPLES
+        from alspec.worked_example import RenderMode
+
+        example = ALL_EXAMPLES["stack"]
+        first = example.render(RenderMode.FULL)
+        assert example.render(RenderMode.FULL) is first
+        assert example.render(RenderMode.FULL, include_table=False) != first
+
 
 class TestStageMethodologyChunks:
     """Verify the new stage methodology chunks."""
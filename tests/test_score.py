@@ -158,3 +158,54 @@ async def test_coverage_does_not_affect_health():
     assert score.health == 1.0  # No checker errors
     assert score.well_formed is True
     assert score.uncovered_cell_count > 0  # But coverage is incomplete
+
+
+@pytest.mark.asyncio
+async def test_format_report_groups_errors_before_warnings():
+    """format_report lists errors, then a counted warning section, in one pass."""
+    from dataclasses import replace
+
+    from alspec.check import Diagnostic, Severity
+    from alspec.report import format_report
+
+    score = await score_spec(load_golden_spec("counter"), strict=True, audit=True)
+    diags = (
+        Diagnostic("a", Severity.WARNING, None, "w1", None),
+        Diagnostic("b", Severity.ERROR, "ax", "e1", None),
+        Diagnostic("c", Severity.INFO, None, "i1", None),
+        Diagnostic("d", Severity.WARNING, None, "w2", None),
+    )
+    text = format_report(replace(score, diagnostics=diags))
+    lines = text.split("\n")
+    assert lines[2] == "    - [b] axiom 'ax': e1 (ERROR)"
+    assert lines[3] == "  ⚠ 2 warnings"
+    assert lines[4:6] == ["    - [a] w1 (WARNING)", "    - [d] w2 (WARNING)"]
+    assert "i1" not in text
+
+
+@pytest.mark.asyncio
+async def test_score_without_coverage_skips_matching():
+    """coverage=False leaves the coverage fields at their defaults."""
+    score = await score_spec(load_golden_spec("stack"), strict=True, audit=True, coverage=False)
+    assert score.obligation_cell_count == 0
+    assert score.coverage_ratio is None
+    assert not [d for d in score.diagnostics if d.check == "coverage"]
+    assert score.well_formed is True
+
+
+@pytest.mark.asyncio
+async def test_report_json_diagnostics():
+    """report_json emits one plain dict per diagnostic, in order."""
+    from alspec.report import report_json
+
+    score = await score_spec(load_golden_spec("counter"), strict=True, audit=True)
+    data = report_json(score)
+    assert len(data["diagnostics"]) == len(score.diagnostics)
+    for entry, diag in zip(data["diagnostics"], score.diagnostics, strict=True):
+        assert entry == {
+            "check": diag.check,
+            "severity": diag.severity.value,
+            "axiom": diag.axiom,
+            "message": diag.message,
+            "path": diag.path,
+        }
@@ -137,3 +137,93 @@ class TestGeneratedSortsRoundTrip:
         orig_keys = {(c.observer_name, c.constructor_name) for c in table_orig.cells}
         rec_keys = {(c.observer_name, c.constructor_name) for c in table_recovered.cells}
         assert orig_keys == rec_keys
+
+
+def test_deeply_nested_formula_encodes_without_recursion() -> None:
+    from alspec.serialization import formula_to_json
+    from alspec.terms import Formula, Negation
+
+    f: Formula = pred_app("p", var("x", "Elem"))
+    for _ in range(5000):
+        f = Negation(f)
+    d = formula_to_json(f)
+    for _ in range(5000):
+        assert d["type"] == "negation"
+        d = d["formula"]
+    assert d == {
+        "type": "pred_app",
+        "pred_name": "p",
+        "args": [{"type": "var", "name": "x", "sort": "Elem"}],
+    }
+
+
+def test_unknown_type_discriminators_are_rejected() -> None:
+    import pytest
+
+    from alspec.serialization import formula_from_json, sort_from_json, term_from_json
+
+    with pytest.raises(ValueError, match="Unknown term type: bogus"):
+        term_from_json({"type": "bogus"})
+    with pytest.raises(ValueError, match="Unknown formula type: bogus"):
+        formula_from_json({"type": "bogus"})
+    with pytest.raises(ValueError, match="Unknown sort type: bogus"):
+        sort_from_json({"type": "bogus"})
+
+
+def test_shared_subterms_encoded_once() -> None:
+    from alspec.serialization import spec_to_json
+
+    x = var("x", "Elem")
+    sig = Signature(
+        sorts={"Elem": atomic("Elem")},
+        functions={},
+        predicates={"p": pred("p", [("x", "Elem")])},
+    )
+    spec = Spec(
+        name="Shared",
+        signature=sig,
+        axioms=(
+            Axiom("a1", forall([x], pred_app("p", x))),
+            Axiom("a2", forall([x], pred_app("p", x))),
+        ),
+    )
+    d = spec_to_json(spec)
+    a1, a2 = (a["formula"] for a in d["axioms"])
+    assert a1["variables"][0] is a2["body"]["args"][0]
+    assert loads(dumps(spec)) == spec
+
+
+def test_decoded_sort_names_are_interned() -> None:
+    from alspec.serialization import term_from_json
+
+    a = term_from_json({"type": "var", "name": "a", "sort": "".join(["Sto", "re"])})
+    b = term_from_json({"type": "var", "name": "b", "sort": "".join(["St", "ore"])})
+    assert a.sort is b.sort  # type: ignore[union-attr]
+
+
+def test_dump_load_file_round_trip(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    from alspec import dump, load
+    from alspec.basis import ALL_BASIS_SPECS
+
+    sp = ALL_BASIS_SPECS[0]()
+    path = tmp_path / "spec.json"
+    with path.open("w") as fp:
+        dump(sp, fp)
+    assert path.read_text() == dumps(sp)
+    with path.open() as fp:
+        assert load(fp) == sp
+
+
+def test_term_in_formula_position_is_rejected() -> None:
+    import pytest
+
+    from alspec.serialization import formula_to_json, term_to_json
+    from alspec.terms import Equation, FnApp, Negation
+
+    t = FnApp(fn_name="f", args=())
+    with pytest.raises(TypeError, match="Unknown formula type"):
+        formula_to_json(t)  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match="Unknown formula type"):
+        formula_to_json(Negation(formula=t))  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match="Unknown term type"):
+        term_to_json(Equation(lhs=t, rhs=t))  # type: ignore[arg-type]